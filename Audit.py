@@ -44,6 +44,7 @@ class Audit:
 DB_Class_Types = {
     "sqlite": Database.SQLiteDatabase,
     "CSV": Database.CSVDatabase,
+    "columnar": Database.ColumnarDatabase,
     # Add other database types here as needed
 }
 
@@ -1,6 +1,10 @@
 import csv
+import glob
 import logging
+import os
 import sqlite3
+import struct
+from collections import Counter
 from Metadata import (
     NodeTypeMetadata,
     CaptureDateMetadata,
@@ -8,7 +12,9 @@ from Metadata import (
     FindTableMetadata,
     MyTag1Metadata,
     FindAndTagMetadata,
+    PIITableMetadata,
 )
+from SchemaTree import SchemaTree
 
 
 class Database:
@@ -25,8 +31,11 @@ class Database:
         logging.info(f"DB Name : {self.db_config['name']}")
         self.connection = self.connect()
         self.objects = []
+        self.schema_tree = SchemaTree()
         # first add the database container with name
-        self.objects.append({"uuid": self.uuid(database=self.db_config["name"])})
+        database_uuid = self.uuid(database=self.db_config["name"])
+        self.objects.append({"uuid": database_uuid})
+        self.schema_tree.add_database(database_uuid, self.db_config["name"])
 
         # add mandatory metadata classes
         self.metadata_classes = [
@@ -51,6 +60,10 @@ class Database:
             self.metadata_classes.append(metadata_instance)
 
     def set_metadata(self):
+        # give extensions the schema tree so they can look at parents and children
+        for metadata_class in self.metadata_classes:
+            metadata_class.set_schema_tree(self.schema_tree)
+
         for obj in self.objects:
             # Add metadata to the object
             for metadata_class in self.metadata_classes:
@@ -70,14 +83,20 @@ class Database:
         database = self.db_config.get("name")
         tables = self.get_tables()
         for table in tables:
-            self.objects.append({"uuid": self.uuid(database, table)})
+            table_uuid = self.uuid(database, table)
+            table_data = {"uuid": table_uuid}
+            table_data.update(self.get_stats(table) or {})
+            self.objects.append(table_data)
+            table_node = self.schema_tree.add_table(table_uuid, table)
             table_columns = self.get_columns(table)
             for column in table_columns:
                 col_type = self.get_type(table, column)
                 column_uuid = self.uuid(database, table, column, col_type)
                 column_data = {"uuid": column_uuid}
+                column_data.update(self.get_stats(table, column) or {})
 
                 self.objects.append(column_data)
+                self.schema_tree.add_column(table_node, column_uuid, column, col_type)
         return self.objects
 
     def connect(self):
@@ -111,6 +130,15 @@ class Database:
         """
         pass
 
+    def get_stats(self, table, column=None):
+        """
+        Gets statistics the database already holds for a table or column, such as row or null counts.
+        :param table: the name of the table.
+        :param column: (optional) the name of the column, omit for table statistics.
+        :return: a dictionary of statistics to add to the object, or None if there are none.
+        """
+        return None
+
     def status(self):
         """
         Prints the status of the database schema, including all tables and columns.
@@ -213,3 +241,205 @@ class CSVDatabase(Database):
     def connect(self):
         # In the case of a CSV file, there's no need for a database connection
         return None
+
+
+class ColumnarDatabase(Database):
+    PARQUET_EXTENSIONS = (".parquet", ".pq")
+    ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+    def __init__(self, capture_event, logger):
+        """
+        Audits Parquet and Arrow IPC files using only their footers, the data pages are never read.
+        The connection string is a file, a directory (searched recursively) or a glob pattern,
+        and each file is treated as a table.
+        """
+        self.logger = logger
+        self.capture_event = capture_event
+        self.files = {}
+        self.schemas = {}
+        self.stats = {}
+        super().__init__(capture_event, logger)
+
+    def connect(self):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("The columnar database type requires pyarrow") from e
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.name = self.db_config["name"]
+
+        path = self.connection_string
+        if os.path.isdir(path):
+            root = path
+            pattern = os.path.join(glob.escape(path), "**", "*")
+            paths = glob.glob(pattern, recursive=True)
+        elif os.path.isfile(path):
+            root = os.path.dirname(path) or "."
+            paths = [path]
+        else:
+            # table names are relative to the directory before any glob characters
+            root = os.path.dirname(glob.escape(path).split("[")[0]) or "."
+            paths = glob.glob(path, recursive=True)
+
+        extensions = self.PARQUET_EXTENSIONS + self.ARROW_EXTENSIONS
+        for file_path in sorted(paths):
+            if os.path.isfile(file_path) and file_path.lower().endswith(extensions):
+                table = os.path.relpath(file_path, root).replace(os.sep, "/")
+                self.files[table] = file_path
+        logging.info(f"Columnar files : {len(self.files)}")
+        if not self.files:
+            logging.warning(f"No Parquet or Arrow files found at {path}")
+        return None
+
+    def get_tables(self):
+        # Read every footer once, skipping files that cannot be read
+        for table, file_path in self.files.items():
+            if table in self.schemas:
+                continue
+            try:
+                if file_path.lower().endswith(self.PARQUET_EXTENSIONS):
+                    self._load_parquet(table, file_path)
+                else:
+                    self._load_arrow(table, file_path)
+            except (OSError, ValueError, self.pa.ArrowException) as e:
+                logging.warning(f"Skipping {file_path} : {e}")
+        return [table for table in self.files if table in self.schemas]
+
+    def get_columns(self, table):
+        return self.schemas[table].names
+
+    def get_type(self, table, column):
+        return str(self.schemas[table].field(column).type)
+
+    def get_stats(self, table, column=None):
+        return self.stats.get((table, column))
+
+    def _load_parquet(self, table, file_path):
+        # ParquetFile only parses the footer, memory-mapped so only its pages are touched
+        metadata = self.pq.ParquetFile(file_path, memory_map=True).metadata
+        schema = metadata.schema.to_arrow_schema()
+        self._check_schema(schema)
+        stats = {
+            (table, None): {
+                "file_format": "parquet",
+                "num_rows": metadata.num_rows,
+                "num_row_groups": metadata.num_row_groups,
+            }
+        }
+        try:
+            for field, index in self._parquet_leaf_indexes(metadata, schema):
+                stats[(table, field.name)] = self._parquet_column_stats(
+                    metadata, index, field.type
+                )
+        except (ValueError, TypeError, self.pa.ArrowException) as e:
+            logging.warning(f"No column statistics for {file_path} : {e}")
+            stats = {(table, None): stats[(table, None)]}
+
+        # only record the table once the whole footer has been read
+        self.schemas[table] = schema
+        self.stats.update(stats)
+
+    def _parquet_leaf_indexes(self, metadata, schema):
+        # Statistics are per leaf column, in schema order. Paths can be ambiguous
+        # (a column named 'a.b' and a struct 'a' with child 'b') so find each field's
+        # leaf by counting the leaves of the fields before it.
+        leaf_counts = [self._leaf_count(field.type) for field in schema]
+        if sum(leaf_counts) != metadata.num_columns:
+            return []
+        indexes = []
+        index = 0
+        for field, leaf_count in zip(schema, leaf_counts):
+            if field.type.num_fields == 0:
+                indexes.append((field, index))
+            index += leaf_count
+        return indexes
+
+    def _leaf_count(self, data_type):
+        # nested types (struct, list, map) store each primitive descendant as a leaf
+        if data_type.num_fields == 0:
+            return 1
+        return sum(
+            self._leaf_count(data_type.field(i).type)
+            for i in range(data_type.num_fields)
+        )
+
+    def _parquet_column_stats(self, metadata, index, data_type):
+        null_count = 0
+        minimum = None
+        maximum = None
+        for row_group in range(metadata.num_row_groups):
+            statistics = metadata.row_group(row_group).column(index).statistics
+            if statistics is None:
+                return {}
+            if statistics.has_null_count and null_count is not None:
+                null_count += statistics.null_count
+            else:
+                null_count = None
+            if statistics.has_min_max:
+                row_group_min = self._stat_value(statistics.min, data_type)
+                row_group_max = self._stat_value(statistics.max, data_type)
+                if minimum is None or row_group_min < minimum:
+                    minimum = row_group_min
+                if maximum is None or row_group_max > maximum:
+                    maximum = row_group_max
+
+        column_stats = {}
+        if null_count is not None:
+            column_stats["null_count"] = null_count
+        if minimum is not None:
+            column_stats["min"] = self._json_value(minimum)
+            column_stats["max"] = self._json_value(maximum)
+        return column_stats
+
+    def _stat_value(self, value, data_type):
+        # Statistics without a Python conversion come back as the raw Parquet bytes
+        if not isinstance(value, bytes):
+            return value
+        if self.pa.types.is_dictionary(data_type):
+            data_type = data_type.value_type
+        if self.pa.types.is_string(data_type) or self.pa.types.is_large_string(
+            data_type
+        ):
+            return value.decode("utf-8", errors="replace")
+        if self.pa.types.is_float16(data_type):
+            return struct.unpack("<e", value)[0]
+        return value
+
+    def _load_arrow(self, table, file_path):
+        # The IPC file footer holds the schema and the record batch locations
+        with self.pa.memory_map(file_path, "r") as source:
+            reader = self.pa.ipc.open_file(source)
+            schema = reader.schema
+            self._check_schema(schema)
+            # Row counts are in each batch's message header, load at most one
+            # column so compressed files are not decompressed in full
+            if len(schema):
+                options = self.pa.ipc.IpcReadOptions(included_fields=[0])
+                reader = self.pa.ipc.open_file(source, options=options)
+            num_rows = sum(
+                reader.get_batch(i).num_rows for i in range(reader.num_record_batches)
+            )
+            self.schemas[table] = schema
+            self.stats[(table, None)] = {
+                "file_format": "arrow",
+                "num_rows": num_rows,
+                "num_record_batches": reader.num_record_batches,
+            }
+
+    def _check_schema(self, schema):
+        # Columns are looked up by name, which is ambiguous if the schema repeats one
+        if len(set(schema.names)) != len(schema.names):
+            duplicates = sorted(
+                name for name, count in Counter(schema.names).items() if count > 1
+            )
+            raise ValueError(f"Duplicate column names {duplicates}")
+
+    def _json_value(self, value):
+        # Statistics are written to the JSON output, so fall back to a string
+        if isinstance(value, bytes):
+            return value.hex()
+        if isinstance(value, (bool, int, float, str)):
+            return value
+        return str(value)
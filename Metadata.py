@@ -1,4 +1,5 @@
 import datetime
+import re
 
 
 class Metadata:
@@ -12,6 +13,14 @@ class Metadata:
         self.name = name
         self.config = config
         self.logger = logger
+        self.schema_tree = None
+
+    def set_schema_tree(self, schema_tree):
+        """
+        Gives the extension access to the discovered database -> table -> column tree.
+        :param schema_tree: a SchemaTree instance
+        """
+        self.schema_tree = schema_tree
 
     def derive_metadata(self, uuid):
         """
@@ -208,3 +217,77 @@ class FindAndTagMetadata(Metadata):
                 results.append({f"tag_{param_name}": tag})
 
         return results if results else None
+
+
+class PIITableMetadata(Metadata):
+    DEFAULT_PII_NAMES = [
+        "ssn",
+        "dob",
+        "address",
+        "phone",
+        "email",
+        "patient_id",
+        "medical_record_number",
+        "health_plan_id",
+    ]
+
+    def __init__(self, name, config, logger=None):
+        """
+        Subclass of Metadata that flags tables having at least one column whose name looks like PII.
+        :param name: the name of the metadata
+        :param config: a dictionary containing configuration parameters
+        :param logger: a logger instance
+        """
+        super().__init__(name, config, logger)
+        self.metadata_parameters = (
+            config["database_config"].get("metadata_parameters", {}).get(name, {})
+        )
+        self.pii_names = [
+            self.name_tokens(pii_name)
+            for pii_name in self.metadata_parameters.get(
+                "column_names", self.DEFAULT_PII_NAMES
+            )
+        ]
+
+    @staticmethod
+    def name_tokens(name):
+        """
+        Split a name into lower case words on punctuation and camelCase boundaries.
+        :param name: a column name, e.g. 'homePhone' or 'email_address'
+        :return: a tuple of words, e.g. ('home', 'phone')
+        """
+        name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+        return tuple(token for token in re.split(r"[^a-z0-9]+", name.lower()) if token)
+
+    def looks_like_pii(self, column_name):
+        """
+        Checks whether the words of any configured PII name appear, in order, in the column name,
+        so 'email' matches 'patient_email' and 'email_address' but not 'emailer'.
+        :param column_name: the name of the column
+        :return: True if the column name contains a PII name
+        """
+        tokens = self.name_tokens(column_name)
+        for pii_tokens in self.pii_names:
+            size = len(pii_tokens)
+            for start in range(len(tokens) - size + 1):
+                if tokens[start : start + size] == pii_tokens:
+                    return True
+        return False
+
+    def derive_metadata(self, uuid):
+        """
+        Adds the 'pii_table' flag and the matching column names to tables with PII-like columns.
+        :param uuid: unique identifier for the database object
+        :return: a dictionary containing the flag if any column matches, otherwise returns None
+        """
+        node = self.schema_tree.get(uuid) if self.schema_tree else None
+        if node is None or node.object_type != "table":
+            return None
+        pii_columns = [
+            column.name
+            for column in node.children.values()
+            if self.looks_like_pii(column.name)
+        ]
+        if pii_columns:
+            return {"pii_table": True, "pii_columns": pii_columns}
+        return None
@@ -0,0 +1,147 @@
+import logging
+
+
+class SchemaNode:
+    __slots__ = ("uuid", "name", "object_type", "data_type", "parent", "children")
+
+    def __init__(self, uuid, name, object_type, data_type=None, parent=None):
+        """
+        A single database, table or column in the schema tree.
+        :param uuid: unique identifier for the database object
+        :param name: the name of the database object
+        :param object_type: one of 'database', 'table' or 'column'
+        :param data_type: (optional) the data type of a column
+        :param parent: (optional) the parent node
+        """
+        self.uuid = uuid
+        self.name = name
+        self.object_type = object_type
+        self.data_type = data_type
+        self.parent = parent
+        # children keyed by name, insertion ordered to match discovery order
+        self.children = {}
+
+    def child(self, name):
+        """
+        Looks up a direct child of this node by name.
+        :param name: the name of the child
+        :return: the child node, or None if there is no child with that name
+        """
+        return self.children.get(name)
+
+    def has_child(self, name):
+        """
+        Checks whether this node has a direct child with the given name.
+        :param name: the name of the child
+        :return: True if the child exists
+        """
+        return name in self.children
+
+    def child_names(self):
+        """
+        :return: a list of the names of the direct children of this node
+        """
+        return list(self.children)
+
+    def siblings(self):
+        """
+        :return: a list of the other children of this node's parent
+        """
+        if self.parent is None:
+            return []
+        return [node for node in self.parent.children.values() if node is not self]
+
+    def __repr__(self):
+        return f"SchemaNode({self.object_type}, {self.uuid})"
+
+
+class SchemaTree:
+    def __init__(self):
+        """
+        A database -> table -> column tree built during discovery, indexed by UUID so
+        metadata extensions can reach an object's parent and children without rescanning
+        the flat object list.
+        """
+        self.root = None
+        self.nodes = {}
+
+    def add_database(self, uuid, name):
+        """
+        Adds the database node, which becomes the root of the tree.
+        :param uuid: unique identifier for the database
+        :param name: the name of the database
+        :return: the new node
+        """
+        self.root = SchemaNode(uuid, name, "database")
+        self.nodes[uuid] = self.root
+        return self.root
+
+    def add_table(self, uuid, name):
+        """
+        Adds a table node under the database node.
+        :param uuid: unique identifier for the table
+        :param name: the name of the table
+        :return: the new node, or the existing node if the UUID or name is already taken
+        """
+        return self._add(SchemaNode(uuid, name, "table", parent=self.root))
+
+    def add_column(self, table, uuid, name, data_type):
+        """
+        Adds a column node under the given table node.
+        :param table: the table node the column belongs to
+        :param uuid: unique identifier for the column
+        :param name: the name of the column
+        :param data_type: the data type of the column
+        :return: the new node, or the existing node if the UUID or name is already taken
+        """
+        return self._add(SchemaNode(uuid, name, "column", data_type, parent=table))
+
+    def _add(self, node):
+        if node.parent is None:
+            raise ValueError(f"No parent for {node.object_type} {node.uuid}")
+        # UUIDs and names are not guaranteed unique, keep the first node rather than replace it
+        existing = self.nodes.get(node.uuid) or node.parent.children.get(node.name)
+        if existing is not None:
+            logging.warning(
+                f"Duplicate {node.object_type} {node.uuid}, keeping {existing}"
+            )
+            return existing
+        node.parent.children[node.name] = node
+        self.nodes[node.uuid] = node
+        return node
+
+    def get(self, uuid):
+        """
+        Looks up a node by UUID.
+        :param uuid: unique identifier for the database object
+        :return: the node, or None if the UUID is not in the tree
+        """
+        return self.nodes.get(uuid)
+
+    def parent(self, uuid):
+        """
+        :param uuid: unique identifier for the database object
+        :return: the parent node, or None for the database node or an unknown UUID
+        """
+        node = self.nodes.get(uuid)
+        return node.parent if node else None
+
+    def children(self, uuid):
+        """
+        :param uuid: unique identifier for the database object
+        :return: a list of the direct children of the object
+        """
+        node = self.nodes.get(uuid)
+        return list(node.children.values()) if node else []
+
+    def tables(self):
+        """
+        :return: a list of all table nodes
+        """
+        return list(self.root.children.values()) if self.root else []
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, uuid):
+        return uuid in self.nodes